@@ -1,6 +1,8 @@
-import ctypes, json, os, platform, shutil, signal, sys, threading, time
+import ctypes, json, os, platform, queue, select, signal, socket, sys, threading, time
 import ctypes.wintypes as wt
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 STD_INPUT_HANDLE = -10
@@ -10,7 +12,56 @@ ENABLE_QUICK_EDIT = 0x0040
 ENABLE_INSERT_MODE = 0x0020
 ENABLE_EXTENDED_FLAGS = 0x0080
 
-kernel32 = ctypes.windll.kernel32
+DELETE = 0x00010000
+SYNCHRONIZE = 0x00100000
+FILE_LIST_DIRECTORY = 0x00000001
+FILE_SHARE_ALL = 0x00000007
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+FILE_FLAG_OPEN_REPARSE_POINT = 0x00200000
+FILE_ATTRIBUTE_DIRECTORY = 0x00000010
+FILE_ATTRIBUTE_REPARSE_POINT = 0x00000400
+IO_REPARSE_TAG_NAME_SURROGATE = 0x20000000
+INVALID_HANDLE_VALUE = wt.HANDLE(-1).value
+
+FILE_DISPOSITION_DELETE = 0x00000001
+FILE_DISPOSITION_POSIX_SEMANTICS = 0x00000002
+FILE_DISPOSITION_IGNORE_READONLY_ATTRIBUTE = 0x00000010
+FileDispositionInformationEx = 64
+FileFullDirectoryInformation = 2
+SCAN_BUFFER_SIZE = 64 * 1024
+
+STATUS_NO_MORE_FILES = 0x80000006
+STATUS_NO_SUCH_FILE = 0xC000000F
+STATUS_INVALID_INFO_CLASS = 0xC0000003
+STATUS_INVALID_PARAMETER = 0xC000000D
+STATUS_NOT_SUPPORTED = 0xC00000BB
+
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+ntdll = ctypes.WinDLL("ntdll", use_last_error=True)
+
+kernel32.CreateFileW.argtypes = [
+    wt.LPCWSTR,
+    wt.DWORD,
+    wt.DWORD,
+    wt.LPVOID,
+    wt.DWORD,
+    wt.DWORD,
+    wt.HANDLE,
+]
+kernel32.CreateFileW.restype = wt.HANDLE
+kernel32.CloseHandle.argtypes = [wt.HANDLE]
+kernel32.CloseHandle.restype = wt.BOOL
+kernel32.SwitchToThread.argtypes = []
+kernel32.SwitchToThread.restype = wt.BOOL
+kernel32.WriteConsoleW.argtypes = [
+    wt.HANDLE,
+    wt.LPCWSTR,
+    wt.DWORD,
+    ctypes.POINTER(wt.DWORD),
+    wt.LPVOID,
+]
+kernel32.WriteConsoleW.restype = wt.BOOL
 
 
 class CONSOLE_SCREEN_BUFFER_INFO(ctypes.Structure):
@@ -23,14 +74,89 @@ class CONSOLE_SCREEN_BUFFER_INFO(ctypes.Structure):
     ]
 
 
+kernel32.GetStdHandle.argtypes = [wt.DWORD]
+kernel32.GetStdHandle.restype = wt.HANDLE
+kernel32.GetConsoleMode.argtypes = [wt.HANDLE, ctypes.POINTER(wt.DWORD)]
+kernel32.GetConsoleMode.restype = wt.BOOL
+kernel32.SetConsoleMode.argtypes = [wt.HANDLE, wt.DWORD]
+kernel32.SetConsoleMode.restype = wt.BOOL
+kernel32.GetConsoleScreenBufferInfo.argtypes = [
+    wt.HANDLE,
+    ctypes.POINTER(CONSOLE_SCREEN_BUFFER_INFO),
+]
+kernel32.GetConsoleScreenBufferInfo.restype = wt.BOOL
+kernel32.SetConsoleScreenBufferSize.argtypes = [wt.HANDLE, wt._COORD]
+kernel32.SetConsoleScreenBufferSize.restype = wt.BOOL
+kernel32.SetConsoleTitleW.argtypes = [wt.LPCWSTR]
+kernel32.SetConsoleTitleW.restype = wt.BOOL
+
+
+class IO_STATUS_BLOCK(ctypes.Structure):
+    _fields_ = [
+        ("Status", wt.LPVOID),
+        ("Information", ctypes.c_size_t),
+    ]
+
+
+class FILE_DISPOSITION_INFORMATION_EX(ctypes.Structure):
+    _fields_ = [("Flags", wt.ULONG)]
+
+
+class FILE_FULL_DIR_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ("NextEntryOffset", wt.ULONG),
+        ("FileIndex", wt.ULONG),
+        ("CreationTime", wt.LARGE_INTEGER),
+        ("LastAccessTime", wt.LARGE_INTEGER),
+        ("LastWriteTime", wt.LARGE_INTEGER),
+        ("ChangeTime", wt.LARGE_INTEGER),
+        ("EndOfFile", wt.LARGE_INTEGER),
+        ("AllocationSize", wt.LARGE_INTEGER),
+        ("FileAttributes", wt.ULONG),
+        ("FileNameLength", wt.ULONG),
+        ("EaSize", wt.ULONG),
+        ("FileName", wt.WCHAR * 1),
+    ]
+
+
+ntdll.NtSetInformationFile.argtypes = [
+    wt.HANDLE,
+    ctypes.POINTER(IO_STATUS_BLOCK),
+    wt.LPVOID,
+    wt.ULONG,
+    ctypes.c_int,
+]
+ntdll.NtSetInformationFile.restype = wt.LONG
+ntdll.NtQueryDirectoryFile.argtypes = [
+    wt.HANDLE,
+    wt.HANDLE,
+    wt.LPVOID,
+    wt.LPVOID,
+    ctypes.POINTER(IO_STATUS_BLOCK),
+    wt.LPVOID,
+    wt.ULONG,
+    ctypes.c_int,
+    wt.BOOLEAN,
+    wt.LPVOID,
+    wt.BOOLEAN,
+]
+ntdll.NtQueryDirectoryFile.restype = wt.LONG
+ntdll.RtlNtStatusToDosError.argtypes = [wt.LONG]
+ntdll.RtlNtStatusToDosError.restype = wt.ULONG
+
+
 def _get_handle(kind: int):
     h = kernel32.GetStdHandle(kind)
-    if h == wt.HANDLE(-1).value:
+    if h is None or h == INVALID_HANDLE_VALUE:
         raise OSError("Failed to get console handle")
     return h
 
 
+COLS = None
+
+
 def harden_console():
+    global COLS
     try:
         h_stdin = _get_handle(STD_INPUT_HANDLE)
         mode = wt.DWORD()
@@ -43,9 +169,11 @@ def harden_console():
 
         h_stdout = _get_handle(STD_OUTPUT_HANDLE)
         csbi = CONSOLE_SCREEN_BUFFER_INFO()
-        kernel32.GetConsoleScreenBufferInfo(h_stdout, ctypes.byref(csbi))
+        ok = kernel32.GetConsoleScreenBufferInfo(h_stdout, ctypes.byref(csbi))
         win_width = csbi.srWindow.Right - csbi.srWindow.Left + 1
         win_height = csbi.srWindow.Bottom - csbi.srWindow.Top + 1
+        if ok:
+            COLS = win_width
         size = wt._COORD(win_width, win_height)
         kernel32.SetConsoleScreenBufferSize(h_stdout, size)
     except Exception:
@@ -72,8 +200,25 @@ FORBIDDEN_PREFIXES = [
     Path(os.path.expandvars("%USERPROFILE%")),
 ]
 
+
+def _resolve_all(paths) -> frozenset:
+    resolved = set()
+    for path in paths:
+        try:
+            resolved.add(str(path.resolve()).lower())
+        except Exception:
+            continue
+    return frozenset(resolved)
+
+
+_FORBIDDEN_RESOLVED = _resolve_all(FORBIDDEN_PREFIXES)
+
 SAFE_MIN_DEPTH = 3
 
+DELETE_RETRIES = 16
+DELETE_BACKOFF = (0.01, 0.02, 0.04, 0.08, 0.16)
+DELETE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
 def is_windows_10():
     return platform.system() == "Windows" and platform.release() in {"10", "11"}
@@ -83,23 +228,45 @@ def eprint(*args):
     print(*args, file=sys.stderr)
 
 
+_CFG_CACHE = (None, None)
+
+
 def load_config():
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return {
-                    "folder": Path(data["folder"]).resolve(strict=False),
-                    "keep_list": [str(x) for x in data.get("keep_list", [])],
-                    "interval": int(data.get("interval", 3600)),
-                }
-        except Exception:
-            return None
-    return None
+    global _CFG_CACHE
+    try:
+        mtime_ns = os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return None
+    if _CFG_CACHE[0] == mtime_ns:
+        return dict(_CFG_CACHE[1])
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            keep_list = [str(x) for x in data.get("keep_list", [])]
+            cfg = {
+                "folder": Path(data["folder"]).resolve(strict=False),
+                "keep_list": keep_list,
+                "keep_lower": casefold_names(keep_list),
+                "interval": int(data.get("interval", 3600)),
+                "retries": max(0, int(data.get("retries", DELETE_RETRIES))),
+            }
+    except Exception:
+        return None
+    _CFG_CACHE = (mtime_ns, cfg)
+    return dict(cfg)
 
 
-def save_config(folder: Path, keep_list: list, interval: int):
-    data = {"folder": str(folder), "keep_list": keep_list, "interval": interval}
+def casefold_names(names) -> frozenset:
+    return frozenset(name.casefold() for name in names)
+
+
+def save_config(folder: Path, keep_list: list, interval: int, retries: int):
+    data = {
+        "folder": str(folder),
+        "keep_list": keep_list,
+        "interval": interval,
+        "retries": retries,
+    }
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -133,8 +300,14 @@ def prompt_config():
         except Exception:
             pass
         print("Invalid number. Try again.")
-    save_config(p, keep_list, interval)
-    return {"folder": p, "keep_list": keep_list, "interval": interval}
+    save_config(p, keep_list, interval, DELETE_RETRIES)
+    return {
+        "folder": p,
+        "keep_list": keep_list,
+        "keep_lower": casefold_names(keep_list),
+        "interval": interval,
+        "retries": DELETE_RETRIES,
+    }
 
 
 def validate_folder(p: Path):
@@ -142,24 +315,20 @@ def validate_folder(p: Path):
         return False
     if p.anchor and p == Path(p.anchor):
         return False
-    parts = [part for part in p.resolve().parts if part not in ("\\", "/")]
+    rp = p.resolve()
+    parts = [part for part in rp.parts if part not in ("\\", "/")]
     if len(parts) < SAFE_MIN_DEPTH:
         return False
-    rp = p.resolve()
-    for bad in FORBIDDEN_PREFIXES:
-        try:
-            if str(rp).lower() == str(bad.resolve()).lower():
-                return False
-        except Exception:
-            continue
-    return True
+    return str(rp).lower() not in _FORBIDDEN_RESOLVED
+
+
+_BAD_CHARS_TBL = str.maketrans("", "", '<>:"/\\|?*')
 
 
 def validate_filename(name: str):
     if not name or len(name) > 255:
         return False
-    bad = set('<>:"/\\|?*')
-    return not any(ch in bad for ch in name)
+    return len(name.translate(_BAD_CHARS_TBL)) == len(name)
 
 
 class Spinner:
@@ -169,6 +338,16 @@ class Spinner:
         self._stop = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self.frames = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        self._frames_w = [
+            ctypes.create_unicode_buffer(f"\r{frame} {text}") for frame in self.frames
+        ]
+        self._clear_w = ctypes.create_unicode_buffer(
+            "\r" + " " * (len(text) + 4) + "\r"
+        )
+        try:
+            self._h = _get_handle(STD_OUTPUT_HANDLE)
+        except OSError:
+            self._h = None
 
     def start(self):
         self._stop.clear()
@@ -176,95 +355,312 @@ class Spinner:
             self._thread = threading.Thread(target=self._run, daemon=True)
             self._thread.start()
 
+    def _write(self, buf):
+        written = wt.DWORD()
+        if self._h is not None and kernel32.WriteConsoleW(
+            self._h, buf, len(buf) - 1, ctypes.byref(written), None
+        ):
+            return
+        self._h = None
+        sys.stdout.write(buf.value)
+        sys.stdout.flush()
+
     def _run(self):
+        sys.stdout.flush()
         i = 0
         while not self._stop.is_set():
-            frame = self.frames[i % len(self.frames)]
-            sys.stdout.write(f"\r{frame} {self.text}")
-            sys.stdout.flush()
-            time.sleep(self.interval)
+            self._write(self._frames_w[i % len(self._frames_w)])
+            self._stop.wait(self.interval)
             i += 1
-        sys.stdout.write("\r" + " " * (len(self.text) + 4) + "\r")
-        sys.stdout.flush()
+        self._write(self._clear_w)
 
     def stop(self):
         self._stop.set()
         self._thread.join(timeout=1)
 
 
-def safe_delete_all(folder: Path, keep_list: list) -> dict:
-    keep_lower = {name.lower() for name in keep_list}
-    deleted, skipped, errors = [], [], []
-    for entry in folder.iterdir():
+def safe_delete_all(folder: str, keep_lower: frozenset, retries: int) -> dict:
+    deleted, skipped, errors = deque(), deque(), deque()
+
+    def delete_entry(name, path, attrs, tag):
         try:
-            if entry.name.lower() in keep_lower:
-                skipped.append(entry.name)
-                continue
-            if entry.is_file():
-                if try_delete(entry):
-                    deleted.append(entry.name)
+            if not attrs & FILE_ATTRIBUTE_DIRECTORY:
+                if try_delete(path, retries):
+                    deleted.append(name)
                 else:
-                    errors.append((entry.name, "access denied"))
-            elif entry.is_dir():
-                try:
-                    shutil.rmtree(entry)
-                    deleted.append(entry.name + "/")
-                except Exception as ex:
-                    errors.append((entry.name, str(ex)))
+                    errors.append((name, "access denied"))
             else:
-                skipped.append(entry.name)
+                if _is_link(attrs, tag):
+                    os.rmdir(path)
+                else:
+                    _rmtree_iter(path, retries)
+                deleted.append(name + "/")
         except Exception as ex:
-            errors.append((entry.name, str(ex)))
+            errors.append((name, str(ex)))
+
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as pool:
+        for name, path, attrs, tag in _scan_dir(folder):
+            if name.casefold() in keep_lower:
+                skipped.append(name)
+                continue
+            pool.submit(delete_entry, name, path, attrs, tag)
     return {"deleted": deleted, "skipped": skipped, "errors": errors}
 
 
-def try_delete(path: Path, retries=3, delay=0.25) -> bool:
-    for _ in range(retries):
+def _nt_error(status: int) -> OSError:
+    return ctypes.WinError(ntdll.RtlNtStatusToDosError(status))
+
+
+_NAME_OFFSET = FILE_FULL_DIR_INFORMATION.FileName.offset
+
+
+def _is_link(attrs: int, tag: int) -> bool:
+    return bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT) and bool(
+        tag & IO_REPARSE_TAG_NAME_SURROGATE
+    )
+
+
+def _scan_dir(root: str):
+    h = kernel32.CreateFileW(
+        root,
+        FILE_LIST_DIRECTORY | SYNCHRONIZE,
+        FILE_SHARE_ALL,
+        None,
+        OPEN_EXISTING,
+        FILE_FLAG_BACKUP_SEMANTICS,
+        None,
+    )
+    if h == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        buf = ctypes.create_string_buffer(SCAN_BUFFER_SIZE)
+        base = ctypes.addressof(buf)
+        iosb = IO_STATUS_BLOCK()
+        while True:
+            status = ntdll.NtQueryDirectoryFile(
+                h,
+                None,
+                None,
+                None,
+                ctypes.byref(iosb),
+                buf,
+                SCAN_BUFFER_SIZE,
+                FileFullDirectoryInformation,
+                False,
+                None,
+                False,
+            )
+            status &= 0xFFFFFFFF
+            if status in (STATUS_NO_MORE_FILES, STATUS_NO_SUCH_FILE):
+                return
+            if status:
+                raise _nt_error(status)
+            offset = 0
+            while True:
+                info = FILE_FULL_DIR_INFORMATION.from_buffer(buf, offset)
+                name = ctypes.wstring_at(
+                    base + offset + _NAME_OFFSET, info.FileNameLength // 2
+                )
+                if name not in (".", ".."):
+                    attrs = info.FileAttributes
+                    tag = info.EaSize if attrs & FILE_ATTRIBUTE_REPARSE_POINT else 0
+                    yield name, os.path.join(root, name), attrs, tag
+                if not info.NextEntryOffset:
+                    break
+                offset += info.NextEntryOffset
+    finally:
+        kernel32.CloseHandle(h)
+
+
+def _rmtree_iter(root: str, retries: int):
+    stack = deque([(root, _scan_dir(root))])
+    try:
+        while stack:
+            path, it = stack[-1]
+            entry = next(it, None)
+            if entry is None:
+                it.close()
+                stack.pop()
+                os.rmdir(path)
+                continue
+            _, entry_path, attrs, tag = entry
+            if not attrs & FILE_ATTRIBUTE_DIRECTORY:
+                if not try_delete(entry_path, retries):
+                    raise PermissionError(13, "access denied", entry_path)
+            elif _is_link(attrs, tag):
+                os.rmdir(entry_path)
+            else:
+                stack.append((entry_path, _scan_dir(entry_path)))
+    finally:
+        for _, it in stack:
+            it.close()
+
+
+_POSIX_UNLINK = True
+
+
+def _posix_unlink(path: str):
+    global _POSIX_UNLINK
+    if not _POSIX_UNLINK:
+        os.remove(path)
+        return
+    h = kernel32.CreateFileW(
+        path,
+        DELETE,
+        FILE_SHARE_ALL,
+        None,
+        OPEN_EXISTING,
+        FILE_FLAG_OPEN_REPARSE_POINT,
+        None,
+    )
+    if h == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        iosb = IO_STATUS_BLOCK()
+        info = FILE_DISPOSITION_INFORMATION_EX(
+            FILE_DISPOSITION_DELETE
+            | FILE_DISPOSITION_POSIX_SEMANTICS
+            | FILE_DISPOSITION_IGNORE_READONLY_ATTRIBUTE
+        )
+        status = ntdll.NtSetInformationFile(
+            h,
+            ctypes.byref(iosb),
+            ctypes.byref(info),
+            ctypes.sizeof(info),
+            FileDispositionInformationEx,
+        )
+    finally:
+        kernel32.CloseHandle(h)
+    status &= 0xFFFFFFFF
+    if status in (
+        STATUS_INVALID_INFO_CLASS,
+        STATUS_INVALID_PARAMETER,
+        STATUS_NOT_SUPPORTED,
+    ):
+        _POSIX_UNLINK = False
+        os.remove(path)
+    elif status:
+        raise _nt_error(status)
+
+
+def try_delete(path: str, retries=DELETE_RETRIES) -> bool:
+    for attempt in range(retries + len(DELETE_BACKOFF) + 1):
+        if attempt:
+            if attempt <= retries:
+                kernel32.SwitchToThread()
+            else:
+                time.sleep(DELETE_BACKOFF[attempt - retries - 1])
         try:
-            os.remove(path)
+            _posix_unlink(path)
             return True
-        except (PermissionError, FileNotFoundError):
-            time.sleep(delay)
+        except FileNotFoundError:
+            return True
+        except PermissionError:
+            continue
     return False
 
 
-def log(msg: str):
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{ts}] {msg}\n"
-    try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
+def timestamp() -> str:
+    t = time.localtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+
+
+_LOG_Q = queue.Queue()
+
+
+def _log_writer():
+    f = None
+    while True:
+        line = _LOG_Q.get()
+        try:
+            if f is None:
+                f = open(LOG_PATH, "a", encoding="utf-8")
             f.write(line)
-    except Exception:
-        pass
+            f.flush()
+        except Exception:
+            pass
+        finally:
+            _LOG_Q.task_done()
+
+
+def start_log_writer():
+    threading.Thread(target=_log_writer, daemon=True).start()
+
+
+def log(msg: str):
+    _LOG_Q.put_nowait(f"[{timestamp()}] {msg}\n")
 
 
 STOP = threading.Event()
+STOP_POLL = 1.0
 
 
 def handle_signal(signum, frame):
     STOP.set()
 
 
-for s in (signal.SIGINT, signal.SIGTERM, getattr(signal, "SIGBREAK", signal.SIGINT)):
+for s in {signal.SIGINT, signal.SIGTERM, getattr(signal, "SIGBREAK", signal.SIGINT)}:
     try:
         signal.signal(s, handle_signal)
     except Exception:
         pass
 
 
-def cleanup_loop(folder: Path, keep_list: list, interval: int):
+def _open_wakeup():
+    r = w = None
+    try:
+        r, w = socket.socketpair()
+        r.setblocking(False)
+        w.setblocking(False)
+        signal.set_wakeup_fd(w.fileno())
+        return r, w
+    except Exception:
+        for sock in (r, w):
+            if sock is not None:
+                sock.close()
+        return None, None
+
+
+_WAKE_R, _WAKE_W = _open_wakeup()
+
+
+def cleanup_loop(folder: Path, keep_lower: frozenset, interval: int, retries: int):
+    folder_str = os.fspath(folder)
     while not STOP.is_set():
         banner()
         spinner = Spinner("Cleaning")
         spinner.start()
-        stats = safe_delete_all(folder, keep_list)
+        stats = safe_delete_all(folder_str, keep_lower, retries)
         spinner.stop()
         print_summary(stats)
         log_summary(stats, folder)
-        for _ in range(interval):
-            if STOP.is_set():
-                break
-            time.sleep(1)
+        if wait_stop(interval):
+            break
+
+
+def wait_stop(timeout: float) -> bool:
+    # Event.wait cannot be interrupted by Ctrl+C on Windows. The wakeup
+    # socket receives a byte as soon as a signal arrives, so select returns
+    # and the handler runs; without it, poll every STOP_POLL seconds.
+    deadline = time.monotonic() + timeout
+    while True:
+        if STOP.is_set():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _WAKE_R is None:
+            STOP.wait(min(remaining, STOP_POLL))
+            continue
+        if select.select([_WAKE_R], [], [], remaining)[0]:
+            try:
+                while _WAKE_R.recv(512):
+                    pass
+            except OSError:
+                pass
 
 
 def print_summary(stats: dict):
@@ -272,7 +668,7 @@ def print_summary(stats: dict):
         f"Deleted {len(stats['deleted'])}, Skipped {len(stats['skipped'])}, Errors {len(stats['errors'])}."
     )
     if stats["errors"]:
-        for name, err in stats["errors"][:5]:
+        for name, err in islice(stats["errors"], 5):
             print(f" - {name}: {err}")
 
 
@@ -282,15 +678,23 @@ def log_summary(stats: dict, folder: Path):
     )
 
 
+_BANNER_BAR = None
+
+
 def banner():
-    cols = 80
-    try:
-        cols = os.get_terminal_size().columns
-    except Exception:
-        pass
+    global _BANNER_BAR
     title = "DelShop"
-    bar = "=" * max(10, min(cols, len(title) + 10))
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if _BANNER_BAR is None:
+        cols = COLS
+        if cols is None:
+            cols = 80
+            try:
+                cols = os.get_terminal_size().columns
+            except Exception:
+                pass
+        _BANNER_BAR = "=" * max(10, min(cols, len(title) + 10))
+    bar = _BANNER_BAR
+    now = timestamp()
     print("\n" + bar)
     print(title)
     print(now)
@@ -304,17 +708,20 @@ def main():
 
     harden_console()
     set_title("DelShop")
+    start_log_writer()
 
     cfg = load_config() or prompt_config()
     folder, keep_list, interval = cfg["folder"], cfg["keep_list"], cfg["interval"]
+    retries = cfg["retries"]
 
     print("\nFolder:", folder)
     print("Keep:", keep_list or "none")
     print("Interval:", interval, "seconds")
 
     try:
-        cleanup_loop(folder, keep_list, interval)
+        cleanup_loop(folder, cfg["keep_lower"], interval, retries)
     finally:
+        _LOG_Q.join()
         print("Exiting.")
 
 